@@ -7,19 +7,66 @@ Single File Solution
 
 import os
 import sys
+import asyncio
 import json
 import random
 import time
 import subprocess
 import threading
+import functools
+import io
+import re
+import base64
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass
 from datetime import datetime, timedelta
 import tempfile
 import shutil
 import math
 from typing import List, Tuple, Dict
 
+# Optional: libgit2 bindings let us build commits in-process
+try:
+    import pygit2
+except ImportError:
+    pygit2 = None
+
+# Optional: orjson reads and writes the config file in C
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Single-key prompts: msvcrt on Windows, termios/tty elsewhere
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+try:
+    import termios
+    import tty
+except ImportError:
+    termios = tty = None
+
 # ================= CONFIG =================
 CONFIG_FILE = "github_real_dates.json"
+# Wire protocol v2 over HTTP/2 for every clone/fetch/push
+GIT_NET_CONFIG = ['-c', 'protocol.version=2', '-c', 'http.version=HTTP/2']
+# Date format shown in commit messages
+GIT_DATE_FORMAT = '%Y-%m-%d %H:%M:%S'
+# Persistent per-repo clones, refreshed with a fetch instead of re-cloned
+CACHE_DIR = os.path.join(os.path.expanduser('~'), '.cache', 'github_real_dates')
+
+def _read_pace():
+    """Seconds the menu lingers on status messages (PACE=1 for the old pacing); 0 never sleeps"""
+    # A malformed value must not stop the bot from starting
+    try:
+        pace = float(os.environ.get('PACE', '0'))
+    except ValueError:
+        return 0.0
+    return pace if math.isfinite(pace) and pace > 0 else 0.0
+
+PACE = _read_pace()
 
 def save_config(token, repos, git_name, git_email):
     config = {
@@ -29,149 +76,630 @@ def save_config(token, repos, git_name, git_email):
         "git_email": git_email,
         "last_setup": datetime.now().isoformat()
     }
-    with open(CONFIG_FILE, 'w') as f:
-        json.dump(config, f, indent=2)
+    if orjson is not None:
+        data = orjson.dumps(config)
+    else:
+        data = json.dumps(config, separators=(',', ':')).encode()
+    
+    # Write next to the real file, then swap it in atomically
+    tmp_file = CONFIG_FILE + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(data)
+    os.replace(tmp_file, CONFIG_FILE)
 
 def load_config():
     if not os.path.exists(CONFIG_FILE):
         return None, None, None, None
     try:
-        with open(CONFIG_FILE, 'r') as f:
-            config = json.load(f)
-        return (
-            config.get("github_token"),
-            config.get("target_repos", []),
-            config.get("git_name"),
-            config.get("git_email")
-        )
-    except:
+        with open(CONFIG_FILE, 'rb') as f:
+            data = f.read()
+        # ValueError covers both JSONDecodeErrors and the UnicodeDecodeError from non-UTF-8 bytes
+        config = orjson.loads(data) if orjson is not None else json.loads(data)
+    except (OSError, ValueError):
+        return None, None, None, None
+    
+    # Valid JSON that isn't an object is as unusable as a corrupt file: run setup again
+    if not isinstance(config, dict):
         return None, None, None, None
+    return (
+        config.get("github_token"),
+        config.get("target_repos", []),
+        config.get("git_name"),
+        config.get("git_email")
+    )
+
+# ================= COMMIT PLAN =================
+@dataclass
+class CommitPlan:
+    """One planned (empty) commit; every string is formatted while planning"""
+    __slots__ = ('timestamp', 'offset', 'git_date', 'repo_url', 'message')
+    timestamp: int     # author/committer date, unix seconds
+    offset: int        # local UTC offset in minutes
+    git_date: str      # GIT_DATE_FORMAT, shown in messages
+    repo_url: str
+    message: str
 
 # ================= GIT DATE COMMIT =================
 class GitDateCommiter:
+    # Base probability of committing, by weekday (0=Monday, 6=Sunday)
+    DAY_PROBABILITIES = (0.85, 0.90, 0.88, 0.87, 0.82, 0.35, 0.25)
+    # Commit count weight, by weekday: Tuesday high ... Sunday very low
+    DAY_WEIGHTS = (0.8, 1.0, 0.9, 0.85, 0.7, 0.3, 0.2)
+    COUNT_VARIATIONS = (-2, -1, 0, 1, 2)
+    
+    # Minimum gap between push starts, and back-off when GitHub pushes back
+    PUSH_INTERVAL = 1.0
+    MAX_PUSH_RETRIES = 5
+    RATE_LIMIT_MARKERS = ('rate limit', 'http 429', 'too many requests', 'retry after', 'abuse')
+    
     def __init__(self, token, repos, git_name, git_email):
         self.token = token
-        self.target_repos = repos
+        # Network git options: the token travels as a per-command header, never in a stored URL
+        credential = base64.b64encode(f"{token}:".encode()).decode()
+        self._net_config = [
+            *GIT_NET_CONFIG,
+            '-c', f'http.https://github.com/.extraHeader=Authorization: Basic {credential}'
+        ]
+        self.set_target_repos(repos)
         self.git_name = git_name
         self.git_email = git_email
         self.commit_count = 0
         self.success_count = 0
         self.fail_count = 0
         self.running = False
+        # Guards the counters above; repo batches run in worker threads
+        self._lock = threading.Lock()
+        # Set by _run_batches on Ctrl+C so workers stop between commits; independent of the UI flag above
+        self._stop = threading.Event()
+        # Environment for every git call, built once; never prompt for credentials,
+        # and keep git's messages in English since push errors are matched on their text
+        self._base_env = {**os.environ, 'GIT_TERMINAL_PROMPT': '0', 'LC_ALL': 'C'}
+        # (repo_dir, commits) batches committed locally, waiting for push_pending()
+        self._pending_pushes = []
+        # Push pacing shared by all worker threads
+        self._push_lock = threading.Lock()
+        self._last_push_ts = 0.0
+        # (counters, text) of the last statistics report; rebuilt only when the counters move
+        self._stats_cache = None
         
         print(f"🔧 Git Commiter initialized")
         print(f"👤 Git User: {git_name} <{git_email}>")
         print(f"🎯 Target repos: {len(repos)}")
     
-    def clone_repo(self, repo_url, temp_dir):
-        """Clone repository to temporary directory"""
+    def set_target_repos(self, repos):
+        """Set the target repos and build their URLs once"""
+        self.target_repos = repos
+        self.repo_urls = tuple(f"https://github.com/CodexNexor/{repo_name}.git" for repo_name in repos)
+    
+    def clone_repo(self, repo_url, repo_dir):
+        """Clone repository into repo_dir"""
         try:
-            # Clone with token authentication
-            auth_url = repo_url.replace('https://', f'https://{self.token}@')
-            cmd = ['git', 'clone', auth_url, temp_dir]
+            # Shallow, blob-less clone: only HEAD is needed to add commits on top.
+            # The plain URL is what lands in .git/config; the token only rides on the command
+            cmd = [
+                'git', *self._net_config, '-c', 'core.fsmonitor=false',
+                'clone', '-q', '--depth=1', '--filter=blob:none', '--no-tags',
+                '--single-branch', '--branch', 'main',
+                repo_url, repo_dir
+            ]
             
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            result = self._run_quiet(cmd, timeout=30)
             
             if result.returncode == 0:
                 return True
-            else:
-                print(f"❌ Clone failed: {result.stderr[:100]}")
-                return False
+            if self._remote_is_empty(repo_url):
+                # Brand-new repo with no branches: the first commit becomes main's root.
+                # A repo that has history but no main still fails here, as it should
+                return self._init_unborn(repo_url, repo_dir)
+            print(f"❌ Clone failed: {result.stderr[:100]}")
+            return False
         except Exception as e:
             print(f"❌ Clone error: {e}")
             return False
     
-    def make_date_commit(self, repo_url, commit_date, commit_message, content):
-        """Make a commit with specific date using Git commands"""
-        temp_dir = None
+    def _remote_is_empty(self, repo_url):
+        """Whether the remote has no branches at all (decided by ls-remote, not by parsing clone errors)"""
+        # Only stdout is read, so stderr gets no pipe
+        result = subprocess.run(
+            ['git', *self._net_config, 'ls-remote', '--heads', repo_url],
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+            env=self._base_env,
+            timeout=30
+        )
+        return result.returncode == 0 and not result.stdout.strip()
+    
+    def _init_unborn(self, repo_url, repo_dir):
+        """Set up repo_dir with an unborn main and origin, for a remote that has no branches yet"""
+        for cmd in (
+            ['git', 'init', '-q', repo_dir],
+            ['git', '-C', repo_dir, 'symbolic-ref', 'HEAD', 'refs/heads/main'],
+            ['git', '-C', repo_dir, 'remote', 'add', 'origin', repo_url],
+        ):
+            result = self._run_quiet(cmd, timeout=10)
+            if result.returncode != 0:
+                print(f"❌ Clone failed: {result.stderr[:100]}")
+                return False
+        return True
+    
+    @staticmethod
+    def _has_main(repo_dir):
+        """Whether refs/heads/main exists yet (not in a fresh empty-repo setup); read without a git call"""
+        git_dir = os.path.join(repo_dir, '.git')
+        if os.path.exists(os.path.join(git_dir, 'refs', 'heads', 'main')):
+            return True
         try:
-            # Create temp directory
-            temp_dir = tempfile.mkdtemp(prefix='github_commit_')
+            with open(os.path.join(git_dir, 'packed-refs')) as f:
+                return any(line.rstrip().endswith(' refs/heads/main') for line in f)
+        except OSError:
+            return False
+    
+    def _run_quiet(self, cmd, timeout, env=None):
+        """
+        Run a git command whose stdout is never read
+        - stdout goes to DEVNULL, stderr is kept for error messages
+        - Never waits on a credential prompt
+        """
+        if env is None:
+            env = self._base_env
+        return subprocess.run(
+            cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            text=True,
+            env=env,
+            timeout=timeout
+        )
+    
+    def _record(self, succeeded=0, failed=0):
+        """Update commit counters (thread-safe)"""
+        with self._lock:
+            self.commit_count += succeeded
+            self.success_count += succeeded
+            self.fail_count += failed
+    
+    def stats_report(self, repo_count):
+        """Statistics block for the menu, formatted once per distinct set of counters"""
+        key = (self.commit_count, self.success_count, self.fail_count, self.running, repo_count)
+        if self._stats_cache is not None and self._stats_cache[0] == key:
+            return self._stats_cache[1]
+        
+        stats = io.StringIO()
+        stats.write(f"\n📊 STATISTICS\n")
+        stats.write("="*40 + "\n")
+        stats.write(f"✅ Total Commits: {self.commit_count}\n")
+        stats.write(f"✅ Successful: {self.success_count}\n")
+        stats.write(f"❌ Failed: {self.fail_count}\n")
+        stats.write(f"🎯 Target Repos: {repo_count}\n")
+        stats.write(f"🏃‍♂️ Status: {'Running' if self.running else 'Stopped'}\n")
+        
+        if self.commit_count > 0:
+            success_rate = (self.success_count / self.commit_count) * 100
+            stats.write(f"📈 Success Rate: {success_rate:.1f}%\n")
             
-            # Clone repo
-            if not self.clone_repo(repo_url, temp_dir):
-                return False
+            stats.write(f"\n📅 GitHub Graph Estimate:\n")
+            estimated_days = min(365, self.success_count // 3)
+            stats.write(f"  • Green days: ~{estimated_days}\n")
+            stats.write(f"  • Total commits: {self.success_count}\n")
             
-            # Change to repo directory
-            os.chdir(temp_dir)
+            if estimated_days >= 365:
+                stats.write(f"  • Status: 🌍 Full year streak!\n")
+            elif estimated_days >= 100:
+                stats.write(f"  • Status: 🔥 {estimated_days}-day streak!\n")
+            elif estimated_days >= 30:
+                stats.write(f"  • Status: ⭐ {estimated_days}-day streak\n")
+            else:
+                stats.write(f"  • Status: 📈 Building...\n")
+        
+        self._stats_cache = (key, stats.getvalue())
+        return self._stats_cache[1]
+    
+    async def _run_quiet_async(self, cmd, timeout):
+        """_run_quiet for the event loop: same streams and environment, returns a CompletedProcess"""
+        proc = await asyncio.create_subprocess_exec(
+            *cmd,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.PIPE,
+            env=self._base_env
+        )
+        try:
+            _, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+        except asyncio.TimeoutError:
+            proc.kill()
+            await proc.wait()
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        return subprocess.CompletedProcess(cmd, proc.returncode, None, stderr.decode(errors='replace'))
+    
+    def _reserve_push_slot(self):
+        """
+        Book the next push start, PUSH_INTERVAL after the previous one
+        Returns how long the caller must wait; safe across threads and coroutines
+        """
+        with self._push_lock:
+            now = time.time()
+            start = max(now, self._last_push_ts + self.PUSH_INTERVAL)
+            self._last_push_ts = start
+            return start - now
+    
+    async def _push(self, repo_dir):
+        """
+        Push HEAD to main
+        - Unshallows the clone only if GitHub rejects a shallow push
+        - Backs off exponentially when rate limited
+        """
+        # pack.threads=0: delta compression for the push uses every core
+        push_cmd = [
+            'git', '-C', repo_dir, *self._net_config, '-c', 'pack.threads=0',
+            'push', '-q', '--force-with-lease', 'origin', 'HEAD:main'
+        ]
+        unshallowed = False
+        retries = 0
+        
+        while True:
+            await asyncio.sleep(self._reserve_push_slot())
+            push_result = await self._run_quiet_async(push_cmd, timeout=120)
+            if push_result.returncode == 0:
+                return push_result
             
-            # Configure git
-            subprocess.run(['git', 'config', 'user.name', self.git_name], check=True)
-            subprocess.run(['git', 'config', 'user.email', self.git_email], check=True)
+            error = push_result.stderr.lower()
+            if not unshallowed and 'shallow update not allowed' in error:
+                print("⚠️  Shallow push rejected, fetching full history...")
+                await self._run_quiet_async(
+                    ['git', '-C', repo_dir, *self._net_config, 'fetch', '-q', '--unshallow', 'origin', 'main'],
+                    timeout=300
+                )
+                unshallowed = True
+                continue
             
-            # Create file with content
-            filename = f"commit_{commit_date.strftime('%Y%m%d_%H%M%S')}.txt"
-            filepath = os.path.join(temp_dir, filename)
+            if retries < self.MAX_PUSH_RETRIES and any(m in error for m in self.RATE_LIMIT_MARKERS):
+                delay = min(60, 2 * 2 ** retries)
+                retries += 1
+                print(f"⏳ Rate limited, retrying push in {delay}s...")
+                await asyncio.sleep(delay)
+                continue
             
-            with open(filepath, 'w') as f:
-                f.write(content)
+            return push_result
+    
+    def make_date_commit(self, repo_url, commit_date, commit_message):
+        """Make a single (empty) commit with specific date using Git commands"""
+        local_date = commit_date.astimezone()
+        plan = CommitPlan(
+            int(local_date.timestamp()),
+            int(local_date.utcoffset().total_seconds() // 60),
+            commit_date.strftime(GIT_DATE_FORMAT),
+            repo_url,
+            commit_message
+        )
+        made = self.make_date_commits_batch(repo_url, [plan], push_at_end=False)
+        return made == 1
+    
+    def make_date_commits_batch(self, repo_url, plans, push_at_end=True):
+        """
+        Make many dated commits on a single clone
+        - Reuses the cached clone of the repo (or clones it once)
+        - Commits each CommitPlan locally (strings are formatted while planning, not here)
+        - push_at_end: queue the repo for push_pending() once every batch is done,
+          otherwise push everything with a single git push right away
+        Returns the number of commits made (queued or pushed)
+        """
+        made = 0
+        try:
+            repo_dir = self.prepare_repo(repo_url)
+            if not repo_dir:
+                self._record(failed=len(plans))
+                return 0
             
-            # Add file
-            subprocess.run(['git', 'add', filename], check=True)
+            if pygit2 is not None:
+                made = self._commit_with_pygit2(repo_dir, plans)
+            else:
+                made = self._commit_with_fast_import(repo_dir, plans)
             
-            # Format date for Git
-            git_date = commit_date.strftime('%Y-%m-%d %H:%M:%S')
+            if made == 0:
+                return 0
             
-            # Commit with custom date
-            env = os.environ.copy()
-            env['GIT_AUTHOR_DATE'] = git_date
-            env['GIT_COMMITTER_DATE'] = git_date
+            if push_at_end:
+                with self._lock:
+                    # An interrupted run pushes nothing; don't queue behind its back
+                    if self._stop.is_set():
+                        return 0
+                    self._pending_pushes.append((repo_dir, made))
+                return made
             
-            commit_cmd = ['git', 'commit', '-m', commit_message]
-            result = subprocess.run(
-                commit_cmd,
-                env=env,
-                capture_output=True,
-                text=True,
-                timeout=10
+            # Push all commits to GitHub at once
+            return asyncio.run(self._push_and_record(repo_dir, made))
+                
+        except Exception as e:
+            print(f"❌ Batch error: {e}")
+            self._record(failed=len(plans) - made)
+            return 0
+    
+    async def _push_and_record(self, repo_dir, made):
+        """Push one repo's local commits and count them as succeeded or failed"""
+        try:
+            push_result = await self._push(repo_dir)
+        except Exception as e:
+            # One broken push should not take the other repos down with it
+            print(f"❌ Push error: {e}")
+            self._record(failed=made)
+            return 0
+        
+        if push_result.returncode == 0:
+            self._record(succeeded=made)
+            return made
+        else:
+            print(f"⚠️  Push failed: {push_result.stderr[:100]}")
+            self._record(failed=made)
+            return 0
+    
+    def push_pending(self):
+        """Push every repo queued by make_date_commits_batch, one push per repo, all concurrently"""
+        with self._lock:
+            pending, self._pending_pushes = self._pending_pushes, []
+        if not pending:
+            return 0
+        
+        for repo_dir, made in pending:
+            print(f"🚀 Pushing {made} commits to {os.path.basename(repo_dir)}...")
+        return sum(asyncio.run(self._push_all(pending)))
+    
+    async def _push_all(self, pending):
+        """Overlap the network time of every push; PUSH_INTERVAL still spaces their starts"""
+        return await asyncio.gather(*(
+            self._push_and_record(repo_dir, made) for repo_dir, made in pending
+        ))
+    
+    def prepare_repo(self, repo_url):
+        """
+        Get an up-to-date working copy of a repo under CACHE_DIR
+        - Warm cache: fetch the latest main and reset onto it
+        - Cold cache (or broken clone): shallow clone into the cache
+        The cached clone is kept for the next run
+        """
+        repo_name = repo_url.split('/')[-1].replace('.git', '')
+        repo_dir = os.path.join(CACHE_DIR, repo_name)
+        
+        if os.path.isdir(os.path.join(repo_dir, '.git')):
+            self._scrub_token(repo_dir, repo_url)
+            steps = (
+                (['git', '-C', repo_dir, *self._net_config, 'fetch', '-q', '--depth=1', 'origin', 'main'], 60),
+                (['git', '-C', repo_dir, 'reset', '-q', '--hard', 'FETCH_HEAD'], 30),
+                # Drop leftovers (e.g. from an interrupted batch) without an rmtree
+                (['git', '-C', repo_dir, 'clean', '-fdxq'], 30),
             )
+            for cmd, timeout in steps:
+                result = self._run_quiet(cmd, timeout=timeout)
+                if result.returncode != 0:
+                    break
+            else:
+                return repo_dir
             
-            if result.returncode != 0:
-                print(f"⚠️  Commit failed: {result.stderr[:100]}")
-                return False
+            # Report the step that actually failed, not just the fetch
+            print(f"⚠️  Cached clone of {repo_name} is stale, re-cloning: {result.stderr[:100]}")
+            self._discard_dir(repo_dir)
+        
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        if not self.clone_repo(repo_url, repo_dir):
+            self._discard_dir(repo_dir)
+            return None
+        
+        return repo_dir
+    
+    def _scrub_token(self, repo_dir, repo_url):
+        """Rewrite a token-bearing origin URL (left by older versions) to the plain repo URL"""
+        try:
+            with open(os.path.join(repo_dir, '.git', 'config')) as f:
+                stored = f.read()
+        except OSError:
+            return
+        if self.token and self.token in stored:
+            self._run_quiet(['git', '-C', repo_dir, 'remote', 'set-url', 'origin', repo_url], timeout=10)
+    
+    def _discard_dir(self, path):
+        """
+        Remove a directory without making the batch wait
+        - Renamed into CACHE_DIR first (same filesystem, so this is instant)
+        - Deleted by a background thread
+        """
+        if not os.path.exists(path):
+            return
+        try:
+            trash_dir = tempfile.mkdtemp(prefix='.trash_', dir=CACHE_DIR)
+            os.replace(path, os.path.join(trash_dir, 'repo'))
+        except OSError:
+            shutil.rmtree(path, ignore_errors=True)
+            return
+        threading.Thread(
+            target=shutil.rmtree,
+            args=(trash_dir,),
+            kwargs={'ignore_errors': True}
+        ).start()
+    
+    def _commit_with_fast_import(self, repo_dir, plans):
+        """
+        Create the batch commits through one git fast-import stream
+        - The first commit continues from main (or is its root if main is unborn), the rest chain inside the stream
+        - No file changes: every commit keeps its parent's tree
+        - fast-import moves main only once the whole stream is in, so a failure commits nothing
+        """
+        identity = f"{self.git_name} <{self.git_email}>".encode()
+        cmd = ['git', '-C', repo_dir, 'fast-import', '--quiet', '--date-format=raw']
+        proc = subprocess.Popen(cmd, stdin=subprocess.PIPE, stdout=subprocess.DEVNULL,
+                                stderr=subprocess.PIPE, env=self._base_env)
+        
+        # Only an existing main can be continued from; otherwise the first commit is a root
+        parent_line = b"from refs/heads/main^0\n" if self._has_main(repo_dir) else b""
+        
+        written = 0
+        try:
+            proc.stdin.write(b"feature done\n")
+            for plan in plans:
+                if self._stop.is_set():
+                    break
+                message = plan.message.encode()
+                # Raw date: unix seconds and the local offset as +hhmm
+                hours, minutes = divmod(abs(plan.offset), 60)
+                when = f"{plan.timestamp} {'-' if plan.offset < 0 else '+'}{hours:02d}{minutes:02d}".encode()
+                proc.stdin.write(b"".join([
+                    b"commit refs/heads/main\n",
+                    b"author %s %s\n" % (identity, when),
+                    b"committer %s %s\n" % (identity, when),
+                    b"data %d\n%s\n" % (len(message), message),
+                    parent_line if written == 0 else b"",
+                    b"\n",
+                ]))
+                written += 1
+            proc.stdin.write(b"done\n")
+        except BrokenPipeError:
+            # fast-import bailed out early; its stderr says why
+            pass
+        finally:
+            try:
+                proc.stdin.close()
+            except BrokenPipeError:
+                # Flushing the tail into a pipe fast-import already closed
+                pass
+        
+        error = proc.stderr.read().decode(errors='replace')
+        if proc.wait() != 0:
+            print(f"⚠️  Commit failed: {error[:100]}")
+            # main never moved, so none of the batch made it in, written or not
+            self._record(failed=len(plans))
+            return 0
+        return written
+    
+    def _commit_with_pygit2(self, repo_dir, plans):
+        """Create the batch commits in-process with pygit2 (no git subprocesses)"""
+        repo = pygit2.Repository(repo_dir)
+        # Empty commits: every one reuses the current tree (the empty tree on an unborn main)
+        if repo.head_is_unborn:
+            parents = []
+            tree_oid = repo.TreeBuilder().write()
+        else:
+            parents = [repo.head.target]
+            tree_oid = repo.head.peel(pygit2.Commit).tree_id
+        
+        made = 0
+        for plan in plans:
+            if self._stop.is_set():
+                break
+            try:
+                signature = pygit2.Signature(self.git_name, self.git_email, plan.timestamp, plan.offset)
+                
+                parents = [repo.create_commit(
+                    'HEAD', signature, signature, plan.message, tree_oid, parents
+                )]
+                made += 1
+            except Exception as e:
+                # One bad commit should not abort the whole batch
+                print(f"❌ Commit error: {e}")
+                self._record(failed=1)
+        return made
+    
+    def _run_batches(self, batches):
+        """
+        Run the per-repo batches in parallel and show progress
+        - Every repo commits locally first
+        - Then each repo is pushed exactly once
+        """
+        total = sum(len(plans) for plans in batches.values())
+        done = 0
+        start_time = time.time()
+        
+        # One worker per repo, up to one per core: repos run concurrently, commits within a repo stay serial.
+        # Threads suffice: the heavy lifting happens in git processes and libgit2, outside the GIL
+        workers = max(1, min(len(batches), os.cpu_count() or 1))
+        try:
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                futures = {
+                    executor.submit(self.make_date_commits_batch, repo_url, plans): repo_url
+                    for repo_url, plans in batches.items()
+                }
+                try:
+                    for future in as_completed(futures):
+                        repo_url = futures[future]
+                        done += len(batches[repo_url])
+                        
+                        # Show progress
+                        elapsed = time.time() - start_time
+                        progress = (done / max(total, 1)) * 100
+                        speed = done / max(elapsed, 1) * 60
+                        
+                        # One write per progress report instead of one per line
+                        sys.stdout.write("\n".join([
+                            f"📊 Progress: {done}/{total} ({progress:.1f}%)",
+                            f"   📝 Committed locally: {future.result()}",
+                            f"   ⏱️  Speed: {speed:.1f} commits/minute",
+                            f"   🔗 Repo: {repo_url.split('/')[-1].replace('.git', '')}",
+                            "",
+                            ""
+                        ]))
+                        sys.stdout.flush()
+                except KeyboardInterrupt:
+                    # Let the workers wind down before the executor joins them
+                    self._stop.set()
+                    raise
+        finally:
+            if self._stop.is_set():
+                # Every worker has been joined by now, so nothing can re-queue after this
+                with self._lock:
+                    self._pending_pushes = []
+            # Only ever set during this call, so later batches (or make_date_commit) run normally
+            self._stop.clear()
+        
+        self.push_pending()
+    
+    def _execute_plans(self, plans, done_title):
+        """
+        Single engine behind every workflow
+        - Groups the CommitPlans by repo, oldest first
+        - Runs one batch per repo (in parallel) and pushes each repo once
+        - Prints the shared summary
+        Returns the number of commits pushed
+        """
+        success_before = self.success_count
+        start_time = time.time()
+        self.running = True
+        
+        try:
+            batches = {}
+            for plan in plans:
+                batches.setdefault(plan.repo_url, []).append(plan)
             
-            # Push to GitHub
-            push_result = subprocess.run(
-                ['git', 'push', 'origin', 'main'],
-                capture_output=True,
-                text=True,
-                timeout=30
-            )
+            # Commit oldest first so each repo's history runs in date order
+            for repo_plans in batches.values():
+                repo_plans.sort(key=lambda plan: plan.timestamp)
             
-            if push_result.returncode == 0:
-                self.commit_count += 1
-                self.success_count += 1
-                return True
-            else:
-                print(f"⚠️  Push failed: {push_result.stderr[:100]}")
-                self.fail_count += 1
-                return False
-                
+            planned = sum(len(repo_plans) for repo_plans in batches.values())
+            print(f"📅 Generated {planned} commit plans across {len(batches)} repos")
+            
+            self._run_batches(batches)
+            total_made = self.success_count - success_before
+            
+            elapsed = time.time() - start_time
+            sys.stdout.write("\n".join([
+                f"\n{done_title}",
+                f"📊 Total commits made: {total_made}",
+                f"⏱️  Time taken: {elapsed/60:.1f} minutes",
+                f"✅ Successful: {self.success_count}",
+                f"❌ Failed: {self.fail_count}",
+                ""
+            ]))
+            sys.stdout.flush()
+            
+            return total_made
+            
+        except KeyboardInterrupt:
+            elapsed = time.time() - start_time
+            print(f"\n🛑 Interrupted after {elapsed/60:.1f} minutes")
+            print(f"📊 Made {self.success_count - success_before} commits")
+            return self.success_count - success_before
         except Exception as e:
-            print(f"❌ Commit error: {e}")
-            self.fail_count += 1
-            return False
+            print(f"❌ Error: {e}")
+            import traceback
+            traceback.print_exc()
+            return self.success_count - success_before
         finally:
-            # Cleanup
-            if temp_dir and os.path.exists(temp_dir):
-                os.chdir('/')
-                try:
-                    shutil.rmtree(temp_dir, ignore_errors=True)
-                except:
-                    pass
-    
-    def generate_repo_urls(self):
-        """Generate repository URLs with token"""
-        repo_urls = []
-        for repo_name in self.target_repos:
-            url = f"https://github.com/CodexNexor/{repo_name}.git"
-            repo_urls.append(url)
-        return repo_urls
+            self.running = False
     
     def humanize_365_days(self, start_date=None, min_commits=1, max_commits=8, activity_factor=0.7):
         """
@@ -195,144 +723,55 @@ class GitDateCommiter:
         if start_date is None:
             start_date = datetime.now() - timedelta(days=365)
         
-        repo_urls = self.generate_repo_urls()
+        repo_urls = self.repo_urls
         if not repo_urls:
             print("❌ No repository URLs generated!")
             return 0
         
-        total_made = 0
-        self.running = True
+        plans = list(self._plan_humanized(repo_urls, start_date, min_commits, max_commits, activity_factor))
+        active_days = len(set(plan.git_date[:10] for plan in plans))
+        print(f"📅 {active_days}/365 active days")
+        print(f"📊 Average: {len(plans)/365:.1f} commits/day")
         
-        try:
-            all_commits = []
-            current_day = start_date
-            
-            # Generate pattern for 365 days
-            for day_index in range(365):
-                if not self.running:
-                    break
-                
-                day_of_week = current_day.weekday()  # 0=Monday, 6=Sunday
-                
-                # Determine if we commit on this day (humanized probability)
-                commit_probability = self._get_day_probability(day_of_week, activity_factor)
-                
-                # Roll the dice - sometimes skip even probable days
-                if random.random() > commit_probability:
-                    current_day += timedelta(days=1)
-                    continue
-                
-                # Determine commit count for this day (humanized distribution)
-                commit_count = self._get_commit_count(day_of_week, min_commits, max_commits)
-                
-                # Create commits for this day
-                for commit_num in range(commit_count):
-                    commit_time = self._get_commit_time(current_day, commit_num, commit_count)
-                    
-                    # Choose random repo
-                    repo_url = random.choice(repo_urls)
-                    
-                    all_commits.append({
-                        'date': commit_time,
-                        'repo_url': repo_url,
-                        'day_index': day_index,
-                        'commit_num': commit_num,
-                        'total_commits': commit_count
-                    })
-                
-                current_day += timedelta(days=1)
-            
-            print(f"📅 Generated {len(all_commits)} commits across {len(set(c['day_index'] for c in all_commits))} active days")
-            print(f"📊 Average: {len(all_commits)/365:.1f} commits/day")
-            
-            # Shuffle for natural distribution
-            random.shuffle(all_commits)
+        return self._execute_plans(plans, "✅ HUMANIZED 365-DAYS COMPLETED!")
+    
+    def _plan_humanized(self, repo_urls, start_date, min_commits, max_commits, activity_factor):
+        """Yield the CommitPlans of a humanized 365-day pattern"""
+        all_commits = []
+        first_weekday = start_date.weekday()
+        
+        # Generate pattern for 365 days
+        for day_index, (midnight, offset) in enumerate(self._day_starts(start_date, range(365))):
+            day_of_week = (first_weekday + day_index) % 7  # 0=Monday, 6=Sunday
             
-            # Process commits
-            start_time = time.time()
-            for i, commit_data in enumerate(all_commits):
-                if not self.running:
-                    break
-                
-                commit_time = commit_data['date']
-                repo_url = commit_data['repo_url']
-                day_index = commit_data['day_index']
-                commit_num = commit_data['commit_num']
-                total_day_commits = commit_data['total_commits']
-                
-                # Create commit message and content
-                commit_message = f"📅 Day {day_index+1}/365 - Commit {commit_num+1}/{total_day_commits}"
-                content = f"""Humanized GitHub contribution
-Date: {commit_time.strftime('%Y-%m-%d %H:%M:%S')}
-Day: {day_index + 1} of 365
-Commit: {commit_num + 1} of {total_day_commits}
-
-This is part of a humanized 365-day contribution pattern.
-Designed to look natural with variable frequency.
-"""
-                
-                # Make commit with specific date
-                success = self.make_date_commit(
-                    repo_url,
-                    commit_time,
-                    commit_message,
-                    content
-                )
-                
-                if success:
-                    total_made += 1
-                
-                # Show progress
-                if (i + 1) % 10 == 0:
-                    elapsed = time.time() - start_time
-                    progress = ((i + 1) / len(all_commits)) * 100
-                    speed = (i + 1) / max(elapsed, 1)
-                    
-                    print(f"📊 Progress: {i+1}/{len(all_commits)} ({progress:.1f}%)")
-                    print(f"   ✅ Successful: {self.success_count}")
-                    print(f"   ⏱️  Speed: {speed:.1f} commits/minute")
-                    print(f"   📅 Date: {commit_time.strftime('%Y-%m-%d')}")
-                    print(f"   🔗 Repo: {repo_url.split('/')[-1].replace('.git', '')}")
-                    print()
-                
-                # Variable delay to look more human
-                delay = random.uniform(1.5, 3.5)
-                time.sleep(delay)
+            # Determine if we commit on this day (humanized probability)
+            commit_probability = self._get_day_probability(day_of_week, activity_factor)
             
-            elapsed = time.time() - start_time
-            print(f"\n✅ HUMANIZED 365-DAYS COMPLETED!")
-            print(f"📊 Total commits made: {total_made}")
-            print(f"📅 Active days: {len(set(c['day_index'] for c in all_commits))}/365")
-            print(f"⏱️  Time taken: {elapsed/60:.1f} minutes")
-            print(f"✅ Successful: {self.success_count}")
-            print(f"❌ Failed: {self.fail_count}")
+            # Roll the dice - sometimes skip even probable days
+            if random.random() > commit_probability:
+                continue
             
-            return total_made
+            # Determine commit count for this day (humanized distribution)
+            commit_count = self._get_commit_count(day_of_week, min_commits, max_commits)
             
-        except KeyboardInterrupt:
-            print(f"\n🛑 Interrupted")
-            return total_made
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            import traceback
-            traceback.print_exc()
-            return total_made
+            # Create commits for this day
+            for commit_num in range(commit_count):
+                timestamp = midnight + self._get_commit_second(commit_num, commit_count)
+                all_commits.append((timestamp, offset, day_index, commit_num, commit_count))
+        
+        # Choose random repos for all commits in one draw
+        chosen_repos = random.choices(repo_urls, k=len(all_commits))
+        
+        for (timestamp, offset, day_index, commit_num, total_day_commits), repo_url in zip(all_commits, chosen_repos):
+            # Create commit message
+            git_date = datetime.fromtimestamp(timestamp).strftime(GIT_DATE_FORMAT)
+            commit_message = f"📅 Day {day_index+1}/365 - Commit {commit_num+1}/{total_day_commits}"
+            yield CommitPlan(timestamp, offset, git_date, repo_url, commit_message)
     
     def _get_day_probability(self, day_of_week, activity_factor):
         """Get probability of committing on a given day"""
-        # Base probabilities (more on weekdays)
-        base_probabilities = {
-            0: 0.85,  # Monday
-            1: 0.90,  # Tuesday
-            2: 0.88,  # Wednesday
-            3: 0.87,  # Thursday
-            4: 0.82,  # Friday
-            5: 0.35,  # Saturday
-            6: 0.25   # Sunday
-        }
-        
         # Apply activity factor
-        prob = base_probabilities[day_of_week] * activity_factor
+        prob = self.DAY_PROBABILITIES[day_of_week] * activity_factor
         
         # Add some randomness
         prob *= random.uniform(0.9, 1.1)
@@ -341,31 +780,20 @@ Designed to look natural with variable frequency.
     
     def _get_commit_count(self, day_of_week, min_commits, max_commits):
         """Get commit count for a day based on day of week"""
-        # Weighted distribution based on day
-        day_weights = {
-            0: 0.8,   # Monday - medium
-            1: 1.0,   # Tuesday - high
-            2: 0.9,   # Wednesday - high
-            3: 0.85,  # Thursday - medium-high
-            4: 0.7,   # Friday - medium
-            5: 0.3,   # Saturday - low
-            6: 0.2    # Sunday - very low
-        }
-        
-        weight = day_weights[day_of_week]
+        weight = self.DAY_WEIGHTS[day_of_week]
         
         # Generate commit count with some randomness
         base_count = int(min_commits + (max_commits - min_commits) * weight)
         
         # Add randomness
         if random.random() < 0.3:  # 30% chance to be different
-            variation = random.choice([-2, -1, 0, 1, 2])
+            variation = random.choice(self.COUNT_VARIATIONS)
             base_count += variation
         
         return max(min_commits, min(max_commits, base_count))
     
-    def _get_commit_time(self, date, commit_num, total_commits):
-        """Get commit time within a day"""
+    def _get_commit_second(self, commit_num, total_commits):
+        """Get a commit's time within its day, in seconds after midnight"""
         # Distribute commits throughout the day
         if total_commits == 1:
             # Single commit around midday
@@ -383,10 +811,25 @@ Designed to look natural with variable frequency.
                 # Middle commits
                 hour = random.randint(10, 17)
         
-        minute = random.randint(0, 59)
-        second = random.randint(0, 59)
-        
-        return date.replace(hour=hour, minute=minute, second=second)
+        # One draw for minute and second together
+        return hour * 3600 + int(random.random() * 3600)
+    
+    def _random_seconds(self, count, first_hour=9, last_hour=18):
+        """Draw count random times of day (seconds after midnight) at once"""
+        # Uniform second of the window == independent hour/minute/second draws
+        return random.choices(range(first_hour * 3600, (last_hour + 1) * 3600), k=count)
+    
+    def _day_starts(self, day, steps):
+        """
+        Local midnight of day shifted by each step (in days), as (unix timestamp, UTC offset minutes)
+        Worked out once per day, so commit times are plain integer offsets from it
+        """
+        midnight = day.replace(hour=0, minute=0, second=0, microsecond=0)
+        starts = []
+        for step in steps:
+            local = (midnight + timedelta(days=step)).astimezone()
+            starts.append((int(local.timestamp()), int(local.utcoffset().total_seconds() // 60)))
+        return starts
     
     def fill_90_days_real(self, commits_per_day=3):
         """Fill 90 days with REAL date commits"""
@@ -398,106 +841,37 @@ Designed to look natural with variable frequency.
         print("⚡ Using Git --date flag for real past dates...")
         print('='*60)
         
-        self.running = True
-        repo_urls = self.generate_repo_urls()
-        
+        repo_urls = self.repo_urls
         if not repo_urls:
             print("❌ No repository URLs generated!")
             return 0
         
-        total_made = 0
-        start_time = time.time()
+        return self._execute_plans(
+            self._plan_fill_90(repo_urls, commits_per_day),
+            "✅ 90-DAY FILL COMPLETED!"
+        )
+    
+    def _plan_fill_90(self, repo_urls, commits_per_day):
+        """Yield the CommitPlans filling the last 90 days"""
+        # Start from yesterday
+        target_days = [
+            start
+            for start in self._day_starts(datetime.now(), range(-1, -91, -1))
+            for _ in range(commits_per_day)
+        ]
         
-        try:
-            # Generate all date-repo pairs
-            today = datetime.now()
-            all_commits = []
-            
-            for day_offset in range(90):
-                target_date = today - timedelta(days=day_offset + 1)  # Start from yesterday
-                
-                for commit_num in range(commits_per_day):
-                    # Random time during day (9 AM to 6 PM)
-                    random_hour = random.randint(9, 18)
-                    random_minute = random.randint(0, 59)
-                    random_second = random.randint(0, 59)
-                    
-                    commit_time = target_date.replace(
-                        hour=random_hour,
-                        minute=random_minute,
-                        second=random_second
-                    )
-                    
-                    # Choose random repo
-                    repo_url = random.choice(repo_urls)
-                    
-                    all_commits.append((commit_time, repo_url, commit_num))
-            
-            print(f"📅 Generated {len(all_commits)} commit plans")
-            
-            # Shuffle for natural distribution
-            random.shuffle(all_commits)
-            
-            # Process commits
-            for i, (commit_time, repo_url, commit_num) in enumerate(all_commits):
-                if not self.running:
-                    break
-                
-                # Create commit message and content
-                commit_message = f"📅 Auto commit: {commit_time.strftime('%Y-%m-%d %H:%M')}"
-                content = f"""Automated commit for GitHub contribution graph
-Date: {commit_time.isoformat()}
-Commit #{i+1}
-Purpose: Fill contribution history
-
-This commit was automatically generated to maintain
-a consistent contribution history on GitHub.
-"""
-                
-                # Make commit with specific date
-                success = self.make_date_commit(
-                    repo_url,
-                    commit_time,
-                    commit_message,
-                    content
-                )
-                
-                if success:
-                    total_made += 1
-                
-                # Show progress
-                if (i + 1) % 5 == 0:
-                    elapsed = time.time() - start_time
-                    speed = (i + 1) / max(elapsed, 1)
-                    progress = ((i + 1) / len(all_commits)) * 100
-                    
-                    print(f"📊 Progress: {i+1}/{len(all_commits)} ({progress:.1f}%)")
-                    print(f"   ✅ Successful: {self.success_count}")
-                    print(f"   ⏱️  Speed: {speed:.1f} commits/minute")
-                    print(f"   📅 Date: {commit_time.strftime('%Y-%m-%d')}")
-                    print(f"   🔗 Repo: {repo_url.split('/')[-1].replace('.git', '')}")
-                    print()
-                
-                # Delay to avoid rate limits
-                time.sleep(2)
-            
-            elapsed = time.time() - start_time
-            print(f"\n✅ 90-DAY FILL COMPLETED!")
-            print(f"📊 Total commits made: {total_made}")
-            print(f"⏱️  Time taken: {elapsed/60:.1f} minutes")
-            print(f"✅ Successful: {self.success_count}")
-            print(f"❌ Failed: {self.fail_count}")
-            
-            return total_made
-            
-        except KeyboardInterrupt:
-            elapsed = time.time() - start_time
-            print(f"\n🛑 Interrupted after {elapsed/60:.1f} minutes")
-            print(f"📊 Made {total_made} commits")
-            return total_made
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            return total_made
+        # Random times during day (9 AM to 6 PM), drawn in bulk
+        seconds = self._random_seconds(len(target_days))
+        
+        # Choose random repos for all commits in one draw
+        chosen_repos = random.choices(repo_urls, k=len(target_days))
+        
+        for (midnight, offset), second, repo_url in zip(target_days, seconds, chosen_repos):
+            # Create commit message
+            timestamp = midnight + second
+            git_date = datetime.fromtimestamp(timestamp).strftime(GIT_DATE_FORMAT)
+            commit_message = f"📅 Auto commit: {git_date[:16]}"
+            yield CommitPlan(timestamp, offset, git_date, repo_url, commit_message)
     
     def make_bulk_date_commits(self, total_commits=100, days_back=365):
         """Make bulk commits with random past dates"""
@@ -507,80 +881,30 @@ a consistent contribution history on GitHub.
         print(f"📅 Date range: Last {days_back} days")
         print('='*60)
         
-        self.running = True
-        repo_urls = self.generate_repo_urls()
-        
+        repo_urls = self.repo_urls
         if not repo_urls:
             print("❌ No repository URLs generated!")
             return 0
         
-        total_made = 0
-        start_time = time.time()
+        return self._execute_plans(
+            self._plan_bulk(repo_urls, total_commits, days_back),
+            "✅ BULK COMMITS COMPLETED!"
+        )
+    
+    def _plan_bulk(self, repo_urls, total_commits, days_back):
+        """Yield CommitPlans on random days within the last days_back days"""
+        # Draw past days, times and repos for every commit up front
+        day_starts = self._day_starts(datetime.now(), range(-1, -days_back - 1, -1))
+        chosen_days = random.choices(day_starts, k=total_commits)
+        seconds = self._random_seconds(total_commits)
+        chosen_repos = random.choices(repo_urls, k=total_commits)
         
-        try:
-            for i in range(total_commits):
-                if not self.running:
-                    break
-                
-                # Generate random past date
-                random_days = random.randint(1, days_back)
-                commit_time = datetime.now() - timedelta(days=random_days)
-                
-                # Random time
-                commit_time = commit_time.replace(
-                    hour=random.randint(9, 18),
-                    minute=random.randint(0, 59),
-                    second=random.randint(0, 59)
-                )
-                
-                # Choose repo
-                repo_url = random.choice(repo_urls)
-                
-                # Create commit
-                commit_message = f"📅 Past commit: {commit_time.strftime('%Y-%m-%d')}"
-                content = f"""Automated past date commit
-Date: {commit_time.isoformat()}
-Commit #{i+1} of {total_commits}
-
-Generated to fill GitHub contribution history.
-"""
-                
-                success = self.make_date_commit(
-                    repo_url,
-                    commit_time,
-                    commit_message,
-                    content
-                )
-                
-                if success:
-                    total_made += 1
-                
-                # Show progress
-                if (i + 1) % 10 == 0:
-                    elapsed = time.time() - start_time
-                    progress = ((i + 1) / total_commits) * 100
-                    speed = (i + 1) / max(elapsed, 1)
-                    
-                    print(f"📊 Progress: {i+1}/{total_commits} ({progress:.1f}%)")
-                    print(f"   ✅ Successful: {self.success_count}")
-                    print(f"   ⏱️  Speed: {speed:.1f} commits/minute")
-                    print(f"   📅 Last date: {commit_time.strftime('%Y-%m-%d')}")
-                
-                # Small delay
-                time.sleep(1.5)
-            
-            elapsed = time.time() - start_time
-            print(f"\n✅ BULK COMMITS COMPLETED!")
-            print(f"📊 Made {total_made} commits with past dates")
-            print(f"⏱️  Time: {elapsed/60:.1f} minutes")
-            
-            return total_made
-            
-        except KeyboardInterrupt:
-            elapsed = time.time() - start_time
-            print(f"\n🛑 Interrupted")
-            print(f"📊 Made {total_made} commits")
-            return total_made
+        for (midnight, offset), second, repo_url in zip(chosen_days, seconds, chosen_repos):
+            # Create commit
+            timestamp = midnight + second
+            git_date = datetime.fromtimestamp(timestamp).strftime(GIT_DATE_FORMAT)
+            commit_message = f"📅 Past commit: {git_date[:10]}"
+            yield CommitPlan(timestamp, offset, git_date, repo_url, commit_message)
     
     def create_streak(self, days=30, commits_per_day=3):
         """Create a streak of commits"""
@@ -590,113 +914,105 @@ Generated to fill GitHub contribution history.
         print(f"📊 Total: {days * commits_per_day} commits")
         print('='*60)
         
-        self.running = True
-        repo_urls = self.generate_repo_urls()
-        
+        repo_urls = self.repo_urls
         if not repo_urls:
             print("❌ No repository URLs generated!")
             return 0
         
-        total_made = 0
-        start_time = time.time()
+        return self._execute_plans(
+            self._plan_streak(repo_urls, days, commits_per_day),
+            f"🎉 {days}-DAY STREAK CREATED!"
+        )
+    
+    def _plan_streak(self, repo_urls, days, commits_per_day):
+        """Yield the CommitPlans of an unbroken streak ending yesterday"""
+        # Days starting from yesterday going backwards, random times drawn in bulk
+        day_starts = self._day_starts(datetime.now(), range(-1, -days - 1, -1))
+        seconds = self._random_seconds(days * commits_per_day)
         
-        try:
-            today = datetime.now()
-            
-            for day_offset in range(days):
-                if not self.running:
-                    break
-                
-                # Date for this day (starting from yesterday going backwards)
-                commit_date = today - timedelta(days=day_offset + 1)
-                
-                print(f"\n📅 Day {day_offset + 1}/{days}: {commit_date.strftime('%Y-%m-%d')}")
-                print('-' * 40)
-                
-                day_commits = 0
-                
-                for commit_num in range(commits_per_day):
-                    # Random time during day
-                    commit_time = commit_date.replace(
-                        hour=random.randint(9, 18),
-                        minute=random.randint(0, 59),
-                        second=random.randint(0, 59)
-                    )
-                    
-                    # Choose repo
-                    repo_url = repo_urls[day_offset % len(repo_urls)]
-                    
-                    # Create commit
-                    commit_message = f"🔥 Day {day_offset + 1}, Commit {commit_num + 1}"
-                    content = f"""Streak building commit
-Date: {commit_time.isoformat()}
-Streak day: {day_offset + 1}/{days}
-Commit: {commit_num + 1}/{commits_per_day}
-
-Building GitHub contribution streak.
-"""
-                    
-                    success = self.make_date_commit(
-                        repo_url,
-                        commit_time,
-                        commit_message,
-                        content
-                    )
-                    
-                    if success:
-                        total_made += 1
-                        day_commits += 1
-                    
-                    # Small delay between commits
-                    time.sleep(1)
-                
-                print(f"   ✅ Day completed: {day_commits} commits")
-                
-                # Delay between days
-                if day_offset < days - 1:
-                    time.sleep(2)
-            
-            elapsed = time.time() - start_time
-            print(f"\n🎉 STREAK CREATED!")
-            print(f"📊 Total commits: {total_made}")
-            print(f"📅 Streak length: {days} days")
-            print(f"⏱️  Time: {elapsed/60:.1f} minutes")
+        for i, second in enumerate(seconds):
+            day_offset, commit_num = divmod(i, commits_per_day)
+            midnight, offset = day_starts[day_offset]
             
-            return total_made
+            # Choose repo
+            repo_url = repo_urls[day_offset % len(repo_urls)]
             
-        except KeyboardInterrupt:
-            elapsed = time.time() - start_time
-            print(f"\n🛑 Streak interrupted")
-            print(f"📊 Made {total_made} commits")
-            return total_made
+            # Create commit
+            timestamp = midnight + second
+            git_date = datetime.fromtimestamp(timestamp).strftime(GIT_DATE_FORMAT)
+            commit_message = f"🔥 Day {day_offset + 1}, Commit {commit_num + 1}"
+            yield CommitPlan(timestamp, offset, git_date, repo_url, commit_message)
 
 # ================= CLI =================
 def clear_screen():
-    os.system('cls' if os.name == 'nt' else 'clear')
+    # ANSI clear + cursor home: no cls/clear process per redraw
+    sys.stdout.write('\x1b[2J\x1b[H')
+    sys.stdout.flush()
 
-def print_banner():
-    banner = """
+# Banner and menu never change: built once at import, written as-is every redraw
+_BANNER = """
 ╔══════════════════════════════════════════════════╗
 ║        🚀 GITHUB AUTO COMMIT BOT 🚀              ║
 ║         REAL DATE COMMITS EDITION                ║
 ╚══════════════════════════════════════════════════╝
+
 """
-    print(banner)
 
-def print_menu():
-    print("\n" + "="*50)
-    print("📋 REAL DATE MENU")
-    print("="*50)
-    print("1. 📅 Fill 90 Days (REAL dates - Git --date flag)")
-    print("2. 🌍 Humanized 365 Days (Natural pattern)")
-    print("3. ⚡ Bulk Past Commits (Random dates)")
-    print("4. 🔥 Create Custom Streak")
-    print("5. 📊 View statistics")
-    print("6. 🎯 Change target repos")
-    print("7. 👤 Change Git user info")
-    print("8. 🔧 Test Git installation")
-    print("9. ❌ Exit")
-    print("="*50)
+_MENU = "\n".join([
+    "\n" + "="*50,
+    "📋 REAL DATE MENU",
+    "="*50,
+    "1. 📅 Fill 90 Days (REAL dates - Git --date flag)",
+    "2. 🌍 Humanized 365 Days (Natural pattern)",
+    "3. ⚡ Bulk Past Commits (Random dates)",
+    "4. 🔥 Create Custom Streak",
+    "5. 📊 View statistics",
+    "6. 🎯 Change target repos",
+    "7. 👤 Change Git user info",
+    "8. 🔧 Test Git installation",
+    "9. ❌ Exit",
+    "="*50,
+    ""
+])
+
+def print_banner(file=None):
+    (file or sys.stdout).write(_BANNER)
+
+def print_menu(file=None):
+    (file or sys.stdout).write(_MENU)
+
+def press_any_key():
+    """
+    Wait for a single keypress, no Enter needed
+    - Piped (non-terminal) input still consumes one line, so scripts keep working
+    - Ctrl+C still raises KeyboardInterrupt
+    """
+    sys.stdout.write("\nPress any key...")
+    sys.stdout.flush()
+    
+    if not sys.stdin.isatty():
+        sys.stdin.readline()
+    elif msvcrt is not None:
+        key = msvcrt.getch()
+        if key == b'\x03':
+            raise KeyboardInterrupt
+        if key in (b'\x00', b'\xe0'):
+            # Arrow/function keys arrive as two codes
+            msvcrt.getch()
+    elif termios is not None:
+        fd = sys.stdin.fileno()
+        old_attrs = termios.tcgetattr(fd)
+        try:
+            # cbreak rather than raw: keys arrive unbuffered but Ctrl+C still signals
+            tty.setcbreak(fd)
+            # Up to 32 bytes swallows a whole escape sequence (arrow keys)
+            os.read(fd, 32)
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, old_attrs)
+    else:
+        sys.stdin.readline()
+    
+    sys.stdout.write("\n")
 
 def get_github_token():
     print("\n" + "="*60)
@@ -714,6 +1030,27 @@ def get_github_token():
     token = input("Token: ").strip()
     return token
 
+@functools.lru_cache(maxsize=1)
+def read_git_user():
+    """
+    Read user.name and user.email with a single git config call
+    Returns a dict like {'user.name': ..., 'user.email': ...}; missing keys are absent
+    Cached for the session; call read_git_user.cache_clear() to re-read
+    """
+    # Only stdout is read, so stderr gets no pipe
+    result = subprocess.run(
+        ['git', 'config', '--get-regexp', r'^user\.(name|email)$'],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.DEVNULL
+    )
+    
+    # One "key value" pair per line; later (more local) scopes override earlier ones
+    user = {}
+    for line in result.stdout.decode('utf-8', 'replace').splitlines():
+        key, _, value = line.partition(' ')
+        user[key] = value.strip()
+    return user
+
 def get_git_user_info():
     print("\n" + "="*60)
     print("👤 GIT USER INFORMATION")
@@ -723,19 +1060,9 @@ def get_git_user_info():
     
     # Try to get from git config
     try:
-        name_result = subprocess.run(
-            ['git', 'config', 'user.name'],
-            capture_output=True,
-            text=True
-        )
-        email_result = subprocess.run(
-            ['git', 'config', 'user.email'],
-            capture_output=True,
-            text=True
-        )
-        
-        git_name = name_result.stdout.strip() if name_result.returncode == 0 else ""
-        git_email = email_result.stdout.strip() if email_result.returncode == 0 else ""
+        git_user = read_git_user()
+        git_name = git_user.get('user.name', "")
+        git_email = git_user.get('user.email', "")
         
         if git_name and git_email:
             print(f"✅ Found Git config: {git_name} <{git_email}>")
@@ -780,76 +1107,74 @@ def get_target_repos():
     
     return repos
 
+# Whole-number answers; checked up front so bad input never reaches int()
+_INT_RE = re.compile(r'-?[0-9]+')
+
 def get_number(prompt, default, min_val, max_val):
     while True:
-        try:
-            value = input(f"{prompt} [{default}]: ").strip()
-            if not value:
-                value = default
-            else:
-                value = int(value)
-            
-            if min_val <= value <= max_val:
-                return value
-            print(f"❌ Must be between {min_val} and {max_val}")
-        except ValueError:
+        value = input(f"{prompt} [{default}]: ").strip()
+        if not value:
+            return default
+        if not _INT_RE.fullmatch(value):
             print("❌ Please enter a number")
+            continue
+        
+        value = int(value)
+        if min_val <= value <= max_val:
+            return value
+        print(f"❌ Must be between {min_val} and {max_val}")
 
-def test_git_installation():
+def test_git_installation(show_version=False):
     print("\n🔧 TESTING GIT INSTALLATION")
     print("="*40)
     
     try:
-        # Test git command
-        result = subprocess.run(
-            ['git', '--version'],
-            capture_output=True,
-            text=True
-        )
-        
-        if result.returncode == 0:
-            print(f"✅ Git installed: {result.stdout.strip()}")
-        else:
-            print("❌ Git not found or not working")
-            print("💡 Install Git from: https://git-scm.com/downloads")
-            return False
-        
-        # Test git config
-        name_result = subprocess.run(
-            ['git', 'config', 'user.name'],
-            capture_output=True,
-            text=True
-        )
-        email_result = subprocess.run(
-            ['git', 'config', 'user.email'],
-            capture_output=True,
-            text=True
-        )
-        
-        if name_result.returncode == 0:
-            print(f"✅ Git user: {name_result.stdout.strip()}")
-        else:
-            print("⚠️  Git user.name not set")
-        
-        if email_result.returncode == 0:
-            print(f"✅ Git email: {email_result.stdout.strip()}")
-        else:
-            print("⚠️  Git user.email not set")
-        
-        return True
-        
+        # The git config read doubles as the install check: no git, no process
+        git_user = read_git_user()
+        # The version string is only worth a process when asked for (menu 8)
+        version = None
+        if show_version:
+            result = subprocess.run(
+                ['git', '--version'],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                check=True
+            )
+            version = result.stdout.decode('ascii', 'ignore').strip()
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        print("❌ Git not found or not working")
+        print("💡 Install Git from: https://git-scm.com/downloads")
+        return False
     except Exception as e:
         print(f"❌ Git test error: {e}")
         return False
+    
+    if version:
+        print(f"✅ Git installed: {version}")
+    else:
+        print("✅ Git installed")
+    
+    if 'user.name' in git_user:
+        print(f"✅ Git user: {git_user['user.name']}")
+    else:
+        print("⚠️  Git user.name not set")
+    
+    if 'user.email' in git_user:
+        print(f"✅ Git email: {git_user['user.email']}")
+    else:
+        print("⚠️  Git user.email not set")
+    
+    return True
 
 def main():
     clear_screen()
     print_banner()
     
-    # Test Git installation
+    # Test Git installation (the only git call before the menu)
     if not test_git_installation():
         print("\n❌ Git is required for real date commits")
         print("💡 Install Git first: https://git-scm.com/downloads")
+        print("💡 After installing, restart your terminal")
         input("Press Enter to exit...")
         return
     
@@ -873,30 +1198,46 @@ def main():
         
         save_config(token, repos, git_name, git_email)
         print(f"\n✅ Configuration saved!")
-        time.sleep(1)
+        if PACE:
+            time.sleep(PACE)
     else:
         print(f"✅ Loaded configuration")
         print(f"👤 Git User: {git_name} <{git_email}>")
         print(f"🎯 Repos: {', '.join(repos[:3])}{'...' if len(repos) > 3 else ''}")
-        time.sleep(1)
+        if PACE:
+            time.sleep(PACE)
     
     # Create commiter
     commiter = GitDateCommiter(token, repos, git_name, git_email)
     
-    # Main loop
-    while True:
-        clear_screen()
-        print_banner()
-        print(f"\n👤 Git User: {git_name}")
-        print(f"📧 Git Email: {git_email}")
-        print(f"🎯 Repos: {len(repos)} repositories")
-        print(f"✅ Total Commits: {commiter.commit_count}")
-        print(f"✅ Successful: {commiter.success_count}")
-        print(f"❌ Failed: {commiter.fail_count}")
-        
-        print_menu()
-        
-        try:
+    # User and counter lines under the banner, rebuilt only when one of them changes
+    header_key = header = None
+    
+    # Main loop; Ctrl+C (or the end of piped input) anywhere in the menu ends the session
+    try:
+        while True:
+            clear_screen()
+            
+            key = (git_name, git_email, len(repos), commiter.commit_count, commiter.success_count, commiter.fail_count)
+            if key != header_key:
+                header_key = key
+                header = "".join([
+                    f"\n👤 Git User: {git_name}\n",
+                    f"📧 Git Email: {git_email}\n",
+                    f"🎯 Repos: {len(repos)} repositories\n",
+                    f"✅ Total Commits: {commiter.commit_count}\n",
+                    f"✅ Successful: {commiter.success_count}\n",
+                    f"❌ Failed: {commiter.fail_count}\n"
+                ])
+            
+            # Render the whole screen in memory, then write it in one go
+            screen = io.StringIO()
+            print_banner(file=screen)
+            screen.write(header)
+            print_menu(file=screen)
+            sys.stdout.write(screen.getvalue())
+            sys.stdout.flush()
+            
             choice = input("\n🎯 Choice (1-9): ").strip()
             
             if choice == '1':
@@ -923,7 +1264,7 @@ def main():
                     if final_confirm == 'y':
                         commiter.fill_90_days_real(commits_per_day)
                 
-                input("\nPress Enter...")
+                press_any_key()
             
             elif choice == '2':
                 print("\n" + "="*60)
@@ -960,7 +1301,7 @@ def main():
                         start_date = datetime.now() - timedelta(days=365)
                         commiter.humanize_365_days(start_date, min_commits, max_commits, activity_factor)
                 
-                input("\nPress Enter...")
+                press_any_key()
             
             elif choice == '3':
                 print("\n" + "="*60)
@@ -974,7 +1315,7 @@ def main():
                 if confirm == 'y':
                     commiter.make_bulk_date_commits(total_commits, days_back)
                 
-                input("\nPress Enter...")
+                press_any_key()
             
             elif choice == '4':
                 print("\n" + "="*60)
@@ -990,88 +1331,68 @@ def main():
                 if confirm == 'y':
                     commiter.create_streak(days, commits_per_day)
                 
-                input("\nPress Enter...")
+                press_any_key()
             
             elif choice == '5':
-                print(f"\n📊 STATISTICS")
-                print("="*40)
-                print(f"✅ Total Commits: {commiter.commit_count}")
-                print(f"✅ Successful: {commiter.success_count}")
-                print(f"❌ Failed: {commiter.fail_count}")
-                print(f"🎯 Target Repos: {len(repos)}")
-                print(f"🏃‍♂️ Status: {'Running' if commiter.running else 'Stopped'}")
-                
-                if commiter.commit_count > 0:
-                    success_rate = (commiter.success_count / commiter.commit_count) * 100
-                    print(f"📈 Success Rate: {success_rate:.1f}%")
-                    
-                    print(f"\n📅 GitHub Graph Estimate:")
-                    estimated_days = min(365, commiter.success_count // 3)
-                    print(f"  • Green days: ~{estimated_days}")
-                    print(f"  • Total commits: {commiter.success_count}")
-                    
-                    if estimated_days >= 365:
-                        print(f"  • Status: 🌍 Full year streak!")
-                    elif estimated_days >= 100:
-                        print(f"  • Status: 🔥 {estimated_days}-day streak!")
-                    elif estimated_days >= 30:
-                        print(f"  • Status: ⭐ {estimated_days}-day streak")
-                    else:
-                        print(f"  • Status: 📈 Building...")
+                # One write for the whole block
+                sys.stdout.write(commiter.stats_report(len(repos)))
+                sys.stdout.flush()
                 
-                input("\nPress Enter...")
+                press_any_key()
             
             elif choice == '6':
                 new_repos = get_target_repos()
                 repos = new_repos
-                save_config(token, repos, git_name, git_email)
-                commiter.target_repos = repos
-                print(f"\n✅ Repositories updated!")
-                input("\nPress Enter...")
+                commiter.set_target_repos(repos)
+                try:
+                    save_config(token, repos, git_name, git_email)
+                    print(f"\n✅ Repositories updated!")
+                except OSError as e:
+                    print(f"\n⚠️  Repositories updated for this session, but the config could not be saved: {e}")
+                press_any_key()
             
             elif choice == '7':
+                # The user may have changed git config since it was cached
+                read_git_user.cache_clear()
                 new_name, new_email = get_git_user_info()
                 git_name, git_email = new_name, new_email
-                save_config(token, repos, git_name, git_email)
                 commiter.git_name = git_name
                 commiter.git_email = git_email
-                print(f"\n✅ Git user info updated!")
-                input("\nPress Enter...")
+                try:
+                    save_config(token, repos, git_name, git_email)
+                    print(f"\n✅ Git user info updated!")
+                except OSError as e:
+                    print(f"\n⚠️  Git user info updated for this session, but the config could not be saved: {e}")
+                press_any_key()
             
             elif choice == '8':
-                test_git_installation()
-                input("\nPress Enter...")
+                # A re-test should see git config as it is now, not the cached startup read
+                read_git_user.cache_clear()
+                test_git_installation(show_version=True)
+                press_any_key()
             
             elif choice == '9':
                 commiter.running = False
                 print("\n👋 Goodbye!")
-                time.sleep(1)
                 break
             
             else:
                 print("❌ Invalid choice")
-                time.sleep(1)
-                
-        except KeyboardInterrupt:
-            print("\n\n🛑 Stopping...")
-            commiter.running = False
-            time.sleep(1)
-            break
-        except Exception as e:
-            print(f"❌ Error: {e}")
-            time.sleep(2)
+                # The next loop clears the screen, so hold the message until it is seen
+                if PACE:
+                    time.sleep(PACE)
+                else:
+                    press_any_key()
+
+    except (KeyboardInterrupt, EOFError):
+        print("\n\n🛑 Stopping...")
+        commiter.running = False
 
 # ================= ENTRY POINT =================
 if __name__ == "__main__":
-    # Check for Git
-    try:
-        subprocess.run(['git', '--version'], capture_output=True)
-    except:
-        print("❌ Git is not installed or not in PATH")
-        print("💡 Download Git from: https://git-scm.com/downloads")
-        print("💡 After installing, restart your terminal")
-        input("Press Enter to exit...")
-        sys.exit(1)
+    # Legacy Windows consoles only honour ANSI escapes once VT processing is switched on
+    if os.name == 'nt':
+        os.system('')
     
     try:
         main()